@@ -1,32 +1,63 @@
+import functools
+import math
 import yaml
 from pathlib import Path
 import numpy as np
 
+# Prefer libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 def load_yaml(path: str):
-    with open(path, "r") as f:
-        data = yaml.safe_load(f)
-    return data
+    return yaml.load(Path(path).read_bytes(), Loader=_YamlLoader)
+
+_ASSETS_ROOT = Path(__file__).resolve().parent.parent.parent / "assets"
 
+@functools.lru_cache(maxsize=None)
 def get_asset_path(relative_path=None):
     """Returns absolute path to SimCore's assets directory."""
-    assets_dir = Path(__file__).parent.parent.parent / "assets"
     if relative_path:
-        return str(assets_dir / relative_path)
-    return str(assets_dir)
+        return str(_ASSETS_ROOT / relative_path)
+    return str(_ASSETS_ROOT)
+
+def _cross3(a, b) -> np.ndarray:
+    """Cross product of two 3-vectors, without np.cross dispatch overhead."""
+    return np.array([a[1] * b[2] - a[2] * b[1],
+                     a[2] * b[0] - a[0] * b[2],
+                     a[0] * b[1] - a[1] * b[0]])
+
+def _rotmat_to_quat_wxyz(R: np.ndarray) -> np.ndarray:
+    """Convert a 3x3 rotation matrix to a (w,x,y,z) quaternion (Shepperd's method)."""
+    (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = R.tolist()
+    tr = r00 + r11 + r22
+    if tr > 0:
+        s = 2.0 * math.sqrt(tr + 1.0)
+        q = (0.25 * s, (r21 - r12) / s, (r02 - r20) / s, (r10 - r01) / s)
+    elif r00 > r11 and r00 > r22:
+        s = 2.0 * math.sqrt(1.0 + r00 - r11 - r22)
+        q = ((r21 - r12) / s, 0.25 * s, (r01 + r10) / s, (r02 + r20) / s)
+    elif r11 > r22:
+        s = 2.0 * math.sqrt(1.0 + r11 - r00 - r22)
+        q = ((r02 - r20) / s, (r01 + r10) / s, 0.25 * s, (r12 + r21) / s)
+    else:
+        s = 2.0 * math.sqrt(1.0 + r22 - r00 - r11)
+        q = ((r10 - r01) / s, (r02 + r20) / s, (r12 + r21) / s, 0.25 * s)
+    return np.array(q)
 
 def look_at_quaternion(eye: np.ndarray, target: np.ndarray, up=np.array([0,0,1])):
     # MuJoCo camera looks along -Z, Y is up in camera frame
-    forward = target - eye
-    forward /= np.linalg.norm(forward)
+    forward = np.asarray(target, dtype=float) - eye
+    forward /= math.sqrt(forward @ forward)
     
     # Camera -Z should align with forward
     # So we need R such that R @ [0,0,-1] = forward
     z_cam = -forward
-    x_cam = np.cross(up, z_cam)
-    x_cam /= np.linalg.norm(x_cam)
-    y_cam = np.cross(z_cam, x_cam)
+    x_cam = _cross3(up, z_cam)
+    x_cam /= math.sqrt(x_cam @ x_cam)
+    y_cam = _cross3(z_cam, x_cam)
     
     R = np.column_stack([x_cam, y_cam, z_cam])
     # Convert rotation matrix to quaternion (w,x,y,z)
-    from scipy.spatial.transform import Rotation
-    return Rotation.from_matrix(R).as_quat()[[3,0,1,2]]  # scipy gives xyzw, convert to wxyz
\ No newline at end of file
+    return _rotmat_to_quat_wxyz(R)
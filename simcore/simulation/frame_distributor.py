@@ -2,7 +2,7 @@ import cv2
 import numpy as np
 import time
 import threading
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from simcore.simulation.sim_model import SimulationModel
@@ -17,13 +17,45 @@ class FrameDistributor:
         self.running = False
 
         self._fps = config.get('render_fps', 30)
-        self._frame_interval = 1.0 / self._fps
+        self._frame_interval_ns = int(1e9 / self._fps)
 
         # Consumers - all optional
         self._display_enabled = False
         self._video_logger: Optional['VideoLogger'] = None
         self._streamer_manager: Optional['StreamerManager'] = None
 
+        # Per-consumer camera lists, resolved once when the consumer is attached
+        self._video_camera_set: frozenset = frozenset()
+        self._stream_cameras: Tuple[str, ...] = ()
+
+        # Display settings, resolved once at construction
+        self._display_cfg = config.get('display', {})
+        self._layout = self._display_cfg.get('layout', 'horizontal')
+        self._grid_cols = self._display_cfg.get('grid_cols', 2)
+        self._window_name = self._display_cfg.get('window_name', 'Camera Views')
+
+        # Frame pool: one render (RGB) and one BGR buffer per camera, allocated
+        # once and overwritten every tick, so _tick allocates nothing in the
+        # steady state. Dict order follows sim.renderers (display tile order).
+        self._frames_rgb: Dict[str, np.ndarray] = {
+            cam_name: np.empty((renderer.height, renderer.width, 3), dtype=np.uint8)
+            for cam_name, renderer in sim.renderers.items()
+        }
+        self._frames: Dict[str, np.ndarray] = {
+            cam_name: np.empty_like(buf) for cam_name, buf in self._frames_rgb.items()
+        }
+
+        # Display composite, allocated on the first displayed frame
+        self._display_canvas: Optional[np.ndarray] = None
+        self._display_tiles: List[Tuple[str, np.ndarray, Optional[np.ndarray], Optional[tuple]]] = []
+
+        # Renderer set is fixed once the model is built; iterate tuples per tick,
+        # with (update_scene, cam_id) pre-bound for the scene update
+        self._renderer_items: Tuple[Tuple[str, object], ...] = tuple(sim.renderers.items())
+        self._scene_updates: Tuple[Tuple[object, int], ...] = tuple(
+            (renderer.update_scene, renderer._cam_id) for _, renderer in self._renderer_items
+        )
+
     # ── Consumer registration ──────────────────────────────────────
 
     def set_display_enabled(self, enabled: bool):
@@ -42,6 +74,10 @@ class FrameDistributor:
             else:
                 print(f"Warning: Camera '{cam_name}' not found for video logging")
 
+        self._video_camera_set = frozenset(
+            cam_name for cam_name in cameras_to_log if cam_name in self.sim.renderers
+        )
+
     def set_streamer_manager(self, streamer_manager: 'StreamerManager'):
         """Attach streamer manager and initialize pipelines with frame dimensions."""
         self._streamer_manager = streamer_manager
@@ -55,6 +91,10 @@ class FrameDistributor:
             else:
                 print(f"Warning: Camera '{cam_name}' not found for streaming")
 
+        self._stream_cameras = tuple(
+            cam_name for cam_name in streamer_manager.get_cameras() if cam_name in self.sim.renderers
+        )
+
     # ── Main loop ──────────────────────────────────────────────────
 
     def run(self):
@@ -65,14 +105,20 @@ class FrameDistributor:
             print("No renderers configured. FrameDistributor exiting.")
             return
 
+        # Fixed-cadence schedule on the monotonic clock: a slow frame does not
+        # shift the following ones, and large overruns resync instead of bursting.
+        interval_ns = self._frame_interval_ns
+        next_deadline = time.monotonic_ns()
+
         while self.running and self.sim.running:
-            t0 = time.time()
             self._tick()
 
-            elapsed = time.time() - t0
-            sleep_time = self._frame_interval - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            next_deadline += interval_ns
+            delay = next_deadline - time.monotonic_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+            else:
+                next_deadline = time.monotonic_ns()
 
         if self._display_enabled:
             cv2.destroyAllWindows()
@@ -86,70 +132,120 @@ class FrameDistributor:
 
     def _tick(self):
         """Render all cameras once and distribute to consumers."""
-        frames: Dict[str, np.ndarray] = {}
+        frames, frames_rgb = self._frames, self._frames_rgb
 
         # Render all configured cameras (under lock for scene update)
+        mj_data = self.sim.mj_data
         with self.sim._lock:
-            for cam_name, renderer in self.sim.renderers.items():
-                renderer.update_scene(self.sim.mj_data, camera=renderer._cam_id)
+            for update_scene, cam_id in self._scene_updates:
+                update_scene(mj_data, camera=cam_id)
 
-        for cam_name, renderer in self.sim.renderers.items():
-            frame_rgb = renderer.render()
-            frame_bgr = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
-            frames[cam_name] = frame_bgr
-            self.sim.set_latest_camera_frame(cam_name, frame_bgr)
+        for cam_name, renderer in self._renderer_items:
+            renderer.render(out=frames_rgb[cam_name])
+            self._convert_frame(cam_name)
 
         # ── Distribute to consumers ──
 
         # 1. Video logging
         if self._video_logger is not None:
-            video_cameras = self.config.get('video_logging', {}).get('cameras', [])
-            for cam_name in video_cameras:
-                if cam_name in frames:
-                    self._video_logger.log_frame(cam_name, frames[cam_name])
+            for cam_name in self._video_camera_set:
+                self._video_logger.log_frame(cam_name, frames[cam_name])
 
         # 2. Streaming
         if self._streamer_manager is not None:
-            for cam_name, frame in frames.items():
-                self._streamer_manager.send_frame(cam_name, frame)
+            for cam_name in self._stream_cameras:
+                self._streamer_manager.send_frame(cam_name, frames[cam_name], frames_rgb[cam_name])
 
         # 3. Display (CV2 windows)
         if self._display_enabled:
             self._update_display(frames)
 
+    def _convert_frame(self, cam_name: str):
+        """Convert a camera's render into its BGR buffer and publish it."""
+        frame_bgr = cv2.cvtColor(self._frames_rgb[cam_name], cv2.COLOR_RGB2BGR, dst=self._frames[cam_name])
+        self.sim.set_latest_camera_frame(cam_name, frame_bgr)
+
+    def _build_display_canvas(self, frames: Dict[str, np.ndarray]):
+        """Allocate the composite display canvas once and cut one tile view per camera."""
+        layout = self._layout
+        shapes = [frame.shape[:2] for frame in frames.values()]
+        cell_h = max(h for h, _ in shapes)
+        cell_w = max(w for _, w in shapes)
+
+        origins = []
+        if len(shapes) == 1 or layout == 'horizontal':
+            x = 0
+            for _, w in shapes:
+                origins.append((0, x))
+                x += w
+            canvas_shape = (cell_h, x)
+        elif layout == 'vertical':
+            y = 0
+            for h, _ in shapes:
+                origins.append((y, 0))
+                y += h
+            canvas_shape = (y, cell_w)
+        else:
+            cols = self._grid_cols
+            rows = (len(shapes) + cols - 1) // cols
+            origins = [(i // cols * cell_h, i % cols * cell_w) for i in range(len(shapes))]
+            canvas_shape = (rows * cell_h, cols * cell_w)
+
+        # Unused grid cells stay black
+        canvas = np.zeros((*canvas_shape, 3), dtype=np.uint8)
+        self._display_canvas = canvas
+        tiles = [canvas[y0:y0 + h, x0:x0 + w] for (y0, x0), (h, w) in zip(origins, shapes)]
+
+        self._display_tiles = []
+        for cam_name, tile, (h, w) in zip(frames, tiles, shapes):
+            coverage, (ly, lx) = self._render_label(cam_name)
+            coverage = coverage[:max(0, h - ly), :max(0, w - lx)]
+            sh, sw = coverage.shape
+            if sh == 0 or sw == 0:
+                # Tile too small to show any of the label
+                self._display_tiles.append((cam_name, tile, None, None))
+                continue
+
+            # Alpha-blend weights for cv2.blendLinear: label colour where the text
+            # covers the pixel, the frame elsewhere (same result as putText)
+            color = np.zeros((sh, sw, 3), dtype=np.uint8)
+            color[..., 1] = 255
+            w_fg = coverage.astype(np.float32) / 255.0
+            w_bg = 1.0 - w_fg
+            label_roi = tile[ly:ly + sh, lx:lx + sw]
+            self._display_tiles.append((cam_name, tile, label_roi, (color, w_bg, w_fg)))
+
+    @staticmethod
+    def _render_label(cam_name: str, origin=(10, 30), pad: int = 3):
+        """Rasterize a camera label once into an antialiased coverage mask.
+
+        Returns the uint8 mask (255 = fully covered) and its (y, x) offset within
+        the tile, placed so the text lands where cv2.putText at ``origin`` would
+        draw it.
+        """
+        font, scale, thickness = cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2
+        (text_w, text_h), baseline = cv2.getTextSize(cam_name, font, scale, thickness)
+        coverage = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad), dtype=np.uint8)
+        cv2.putText(coverage, cam_name, (pad, pad + text_h), font, scale, 255, thickness, cv2.LINE_AA)
+        ly = max(0, origin[1] - text_h - pad)
+        lx = max(0, origin[0] - pad)
+        return coverage, (ly, lx)
+
     def _update_display(self, frames: Dict[str, np.ndarray]):
         """Compose and show frames in CV2 window."""
-        display_frames = []
-        for cam_name, frame in frames.items():
-            annotated = frame.copy()
-            cv2.putText(
-                annotated, cam_name, (10, 30),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2, cv2.LINE_AA
-            )
-            display_frames.append(annotated)
-
-        if not display_frames:
+        if not frames:
             return
 
-        display_cfg = self.config.get('display', {})
-        layout = display_cfg.get('layout', 'horizontal')
+        if self._display_canvas is None:
+            self._build_display_canvas(frames)
 
-        if len(display_frames) == 1:
-            combined = display_frames[0]
-        elif layout == 'horizontal':
-            combined = np.hstack(display_frames)
-        elif layout == 'vertical':
-            combined = np.vstack(display_frames)
-        else:
-            cols = display_cfg.get('grid_cols', 2)
-            rows = (len(display_frames) + cols - 1) // cols
-            while len(display_frames) < rows * cols:
-                display_frames.append(np.zeros_like(display_frames[0]))
-            grid_rows = [np.hstack(display_frames[i * cols:(i + 1) * cols]) for i in range(rows)]
-            combined = np.vstack(grid_rows)
-
-        window_name = display_cfg.get('window_name', 'Camera Views')
-        cv2.imshow(window_name, combined)
+        # Blit each frame into its tile and overlay the prerendered label in place
+        for cam_name, tile, label_roi, blend in self._display_tiles:
+            np.copyto(tile, frames[cam_name])
+            if blend is not None:
+                cv2.blendLinear(label_roi, *blend, dst=label_roi)
+
+        cv2.imshow(self._window_name, self._display_canvas)
 
         if cv2.waitKey(1) & 0xFF == ord('q'):
             self.running = False
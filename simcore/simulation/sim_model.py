@@ -359,7 +359,12 @@ class SimulationModel:
     
     def set_latest_camera_frame(self, camera_name: str, frame: np.ndarray):
         with self._latest_frames_lock:
-            self._latest_frames[camera_name] = frame.copy()
+            latest = self._latest_frames.get(camera_name)
+            # Readers copy under the lock, so the stored buffer can be reused
+            if latest is None or latest.shape != frame.shape:
+                self._latest_frames[camera_name] = frame.copy()
+            else:
+                np.copyto(latest, frame)
 
     def get_latest_camera_frame(self, camera_name: str) -> Optional[np.ndarray]:
         with self._latest_frames_lock:
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections import deque
+import threading
 import numpy as np
-from typing import Optional, Tuple
+from typing import Deque, Optional, Tuple
 
 
 class BaseStreamer(ABC):
@@ -8,29 +10,105 @@ class BaseStreamer(ABC):
     
     Follows the same pattern as BaseController - subclass and implement
     the abstract methods for different streaming backends (GStreamer, FFmpeg, WebRTC, etc.)
+
+    send_frame() only queues the frame; a worker thread hands it to the backend
+    via _send_frame_impl(). The queue is bounded and drops the oldest frame when
+    full, so encoder backpressure never stalls the render loop.
     """
 
+    # Channel order the pipeline expects on input ('BGR' or 'RGB'); overridable per stream via 'format'
+    default_pixel_format = 'BGR'
+    PIXEL_FORMATS = ('BGR', 'RGB')
+
     def __init__(self, config: dict):
         self.config = config
         self._initialized = False
         self._width: int = 0
         self._height: int = 0
         self._fps: int = 30
+        self.pixel_format: str = str(config.get('format', self.default_pixel_format)).upper()
+        if self.pixel_format not in self.PIXEL_FORMATS:
+            raise ValueError(f"Unsupported stream format '{self.pixel_format}', "
+                             f"expected one of {list(self.PIXEL_FORMATS)}")
+
+        queue_size = config.get('queue_size', 2)
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError(f"queue_size must be an integer >= 1, got {queue_size!r}")
+        self._queue: Deque = deque(maxlen=queue_size)
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_running = False
 
     @abstractmethod
     def initialize(self, width: int, height: int, fps: int = 30):
         """Initialize the streaming pipeline with frame dimensions and target fps."""
         pass
 
-    @abstractmethod
     def send_frame(self, frame: np.ndarray):
-        """Push a single BGR frame into the streaming pipeline.
+        """Queue a single frame for the streaming pipeline without blocking.
         
         Args:
-            frame: BGR image as numpy array (H, W, 3), uint8
+            frame: image as numpy array (H, W, 3), uint8, in ``pixel_format`` channel order
+        """
+        if self._worker is None:
+            self._start_worker()
+
+        try:
+            item = self._prepare_frame(frame)
+        except Exception as e:
+            self._on_send_error(e)
+            return
+
+        with self._cond:
+            self._queue.append(item)
+            self._cond.notify()
+
+    def _prepare_frame(self, frame: np.ndarray):
+        """Take ownership of a frame before it is queued.
+
+        Callers reuse their frame buffers, so the default is a copy. Backends
+        may override this to copy straight into their own buffer type.
         """
+        return frame.copy()
+
+    @abstractmethod
+    def _send_frame_impl(self, item):
+        """Push one prepared frame into the pipeline. Runs on the worker thread."""
         pass
 
+    def _start_worker(self):
+        self._worker_running = True
+        self._worker = threading.Thread(target=self._drain, daemon=True)
+        self._worker.start()
+
+    def _stop_worker(self):
+        """Stop the worker thread and drop any frames still queued."""
+        with self._cond:
+            self._worker_running = False
+            self._cond.notify()
+        if self._worker is not None:
+            self._worker.join(timeout=1.0)
+            self._worker = None
+        self._queue.clear()
+
+    def _drain(self):
+        while True:
+            with self._cond:
+                while self._worker_running and not self._queue:
+                    self._cond.wait()
+                if not self._worker_running:
+                    return
+                item = self._queue.popleft()
+            try:
+                self._send_frame_impl(item)
+            except Exception as e:
+                self._on_send_error(e)
+
+    def _on_send_error(self, error: Exception):
+        """Log a failed frame, drop it and mark the stream as no longer initialized."""
+        print(f"{type(self).__name__} send_frame error: {error}")
+        self._initialized = False
+
     @abstractmethod
     def stop(self):
         """Tear down the streaming pipeline and release resources."""
@@ -10,21 +10,41 @@ from simcore.streaming.base_streamer import BaseStreamer
 
 Gst.init(None)
 
+# H.264 encoders in order of preference: hardware first, x264enc as software fallback
+H264_ENCODERS = ('nvh264enc', 'vaapih264enc', 'v4l2h264enc', 'vtenc_h264', 'x264enc')
+
+
+def _pick_h264_encoder() -> str:
+    """Return the first H.264 encoder element available in this GStreamer install."""
+    for name in H264_ENCODERS:
+        if Gst.ElementFactory.find(name) is not None:
+            return name
+    return 'x264enc'
+
 
 class GStreamerUDPStreamer(BaseStreamer):
 
+    # The pipeline converts to YUV for the encoder anyway, so the raw RGB
+    # render can be pushed as-is without a channel swap upstream. Callers of
+    # send_frame() must pass RGB frames, or set 'format: BGR' to push BGR.
+    default_pixel_format = 'RGB'
+
     def __init__(self, config: dict):
         super().__init__(config)
         self._pipeline = None
         self._appsrc = None
         self._frame_count = 0
         self._frame_duration = 0  # nanoseconds, set in initialize()
+        # Whether Buffer.map() gives a writable view (needs gst-python's overrides);
+        # probed on the first frame
+        self._writable_map: Optional[bool] = None
 
         self.host = config.get('host', '127.0.0.1')
         self.port = config.get('port', 5000)
         self.bitrate = config.get('bitrate', 2000)
         self.tune = config.get('tune', 'zerolatency')
         self.speed_preset = config.get('speed_preset', 'ultrafast')
+        self.encoder = config.get('encoder', 'auto')
 
     def initialize(self, width: int, height: int, fps: int = 30):
         """Build and start the GStreamer pipeline."""
@@ -34,12 +54,31 @@ class GStreamerUDPStreamer(BaseStreamer):
         self._frame_count = 0
         self._frame_duration = Gst.SECOND // fps  # nanoseconds per frame
 
+        encoder = _pick_h264_encoder() if self.encoder == 'auto' else self.encoder
+        started = self._start_pipeline(width, height, fps, encoder)
+
+        # An auto-picked hardware encoder can exist but still fail to negotiate/start
+        if not started and self.encoder == 'auto' and encoder != 'x264enc':
+            print(f"GStreamer encoder '{encoder}' failed to start, falling back to x264enc")
+            encoder = 'x264enc'
+            started = self._start_pipeline(width, height, fps, encoder)
+
+        if not started:
+            self._initialized = False
+            return
+
+        time.sleep(0.2)
+
+        self._initialized = True
+        print(f"GStreamer UDP streamer started -> {self.host}:{self.port} "
+              f"({width}x{height} @ {fps}fps, {self.bitrate}kbps, {encoder})")
+
+    def _start_pipeline(self, width: int, height: int, fps: int, encoder: str) -> bool:
+        """Build the pipeline with ``encoder`` and bring it to PLAYING. Returns success."""
         pipeline_str = (
             f'appsrc name=src is-live=true format=time '
-            f'! video/x-raw,format=BGR,width={width},height={height},framerate={fps}/1 '
-            f'! videoconvert '
-            f'! x264enc tune={self.tune} speed-preset={self.speed_preset} '
-            f'  bitrate={self.bitrate} key-int-max={fps} '
+            f'! video/x-raw,format={self.pixel_format},width={width},height={height},framerate={fps}/1 '
+            f'! {self._encoder_stage(encoder, fps)} '
             f'! rtph264pay config-interval=1 pt=96 '
             f'! udpsink host={self.host} port={self.port} sync=false'
         )
@@ -61,28 +100,29 @@ class GStreamerUDPStreamer(BaseStreamer):
 
             # Now wait for pipeline to reach PLAYING
             ret = self._pipeline.get_state(5 * Gst.SECOND)
-            if ret[1] not in (Gst.State.PLAYING, Gst.State.PAUSED):
-                print(f"GStreamer pipeline failed to reach PLAYING state: {ret}")
-                self._initialized = False
-                return
-
-            time.sleep(0.2)
-
-            self._initialized = True
-            print(f"GStreamer UDP streamer started -> {self.host}:{self.port} "
-                  f"({width}x{height} @ {fps}fps, {self.bitrate}kbps)")
+            if ret[1] in (Gst.State.PLAYING, Gst.State.PAUSED):
+                return True
+            print(f"GStreamer pipeline failed to reach PLAYING state: {ret}")
 
         except Exception as e:
             print(f"Error starting GStreamer pipeline: {e}")
-            self._initialized = False
 
-    def send_frame(self, frame: np.ndarray):
-        """Push a timestamped BGR frame into the GStreamer pipeline."""
+        if self._pipeline is not None:
+            self._pipeline.set_state(Gst.State.NULL)
+        self._pipeline = None
+        self._appsrc = None
+        self._frame_count = 0
+        return False
+
+    def _prepare_frame(self, frame: np.ndarray):
+        return self._frame_to_buffer(frame)
+
+    def _send_frame_impl(self, buf):
+        """Push a timestamped buffer into the GStreamer pipeline."""
         if not self._initialized or self._appsrc is None:
             return
 
         try:
-            buf = Gst.Buffer.new_wrapped(frame.tobytes())
             buf.pts = self._frame_count * self._frame_duration
             buf.dts = self._frame_count * self._frame_duration
             buf.duration = self._frame_duration
@@ -97,8 +137,63 @@ class GStreamerUDPStreamer(BaseStreamer):
             print(f"GStreamer send_frame error: {e}")
             self._initialized = False
 
+    def _encoder_stage(self, encoder: str, fps: int) -> str:
+        """Pipeline fragment converting raw frames and encoding them with ``encoder``.
+
+        Hardware encoders get NV12 input, which is what most of them expect.
+        For nvh264enc the conversion runs on the GPU when the CUDA elements are
+        available, so frames are uploaded once and never converted on the CPU.
+        """
+        if encoder == 'x264enc':
+            return (f'videoconvert '
+                    f'! x264enc tune={self.tune} speed-preset={self.speed_preset} '
+                    f'  bitrate={self.bitrate} key-int-max={fps}')
+
+        if encoder == 'nvh264enc':
+            props = f'preset=low-latency-hq zerolatency=true gop-size={fps} bitrate={self.bitrate}'
+        elif encoder == 'vaapih264enc':
+            props = f'rate-control=cbr bitrate={self.bitrate} keyframe-period={fps}'
+        elif encoder == 'v4l2h264enc':
+            props = f'extra-controls="controls,video_bitrate={self.bitrate * 1000},h264_i_frame_period={fps}"'
+        elif encoder == 'vtenc_h264':
+            props = f'realtime=true allow-frame-reordering=false bitrate={self.bitrate} max-keyframe-interval={fps}'
+        else:
+            props = ''
+
+        if encoder == 'nvh264enc' and all(Gst.ElementFactory.find(e) for e in ('cudaupload', 'cudaconvert')):
+            convert = 'cudaupload ! cudaconvert ! video/x-raw(memory:CUDAMemory),format=NV12'
+        else:
+            convert = 'videoconvert ! video/x-raw,format=NV12'
+        return f'{convert} ! {encoder} {props}'.rstrip()
+
+    def _frame_to_buffer(self, frame: np.ndarray):
+        """Copy a frame into a GStreamer buffer that owns its memory.
+
+        With gst-python installed, the frame is copied straight into a mapped
+        Gst-allocated buffer, avoiding the intermediate ``frame.tobytes()``
+        object. Plain PyGObject only maps to a read-only copy, so in that case
+        this falls back to ``Gst.Buffer.new_wrapped(frame.tobytes())``. Either
+        way the caller may reuse ``frame`` immediately.
+        """
+        if self._writable_map is not False:
+            buf = Gst.Buffer.new_allocate(None, frame.nbytes, None)
+            ok, info = buf.map(Gst.MapFlags.WRITE)
+            if ok:
+                try:
+                    data = info.data
+                    self._writable_map = isinstance(data, memoryview) and not data.readonly
+                    if self._writable_map:
+                        np.copyto(np.frombuffer(data, dtype=np.uint8).reshape(frame.shape), frame)
+                        return buf
+                finally:
+                    buf.unmap(info)
+            else:
+                self._writable_map = False
+        return Gst.Buffer.new_wrapped(frame.tobytes())
+
     def stop(self):
         """Tear down the GStreamer pipeline."""
+        self._stop_worker()
         if self._pipeline is not None:
             try:
                 self._appsrc.emit('end-of-stream')
@@ -1,4 +1,5 @@
-from typing import Dict, List
+import cv2
+from typing import Dict, List, Tuple
 
 from simcore.streaming.base_streamer import BaseStreamer
 
@@ -34,6 +35,9 @@ class StreamerManager:
               host: 127.0.0.1
               port: 5000
               bitrate: 2000
+              format: RGB        # optional, input channel order (RGB or BGR); gstreamer_udp defaults to RGB
+              encoder: auto      # optional, default auto (hardware if available, else x264enc)
+              queue_size: 2      # optional, frames buffered before the oldest is dropped
             - camera: eye_in_hand
               backend: gstreamer_udp
               host: 127.0.0.1
@@ -50,6 +54,12 @@ class StreamerManager:
         if self.enabled:
             self._build_from_config()
 
+        # Frozen per-frame dispatch plan (streamer set is fixed after config build)
+        self._cameras_tuple: Tuple[str, ...] = tuple(self._streamers.keys())
+        self._send_plan: Dict[str, Tuple[BaseStreamer, ...]] = {
+            k: tuple(v) for k, v in self._streamers.items()
+        }
+
     def _build_from_config(self):
         """Instantiate streamers based on config."""
         for stream_cfg in self.config.get('streams', []):
@@ -77,17 +87,24 @@ class StreamerManager:
         for streamer in self._streamers[camera_name]:
             streamer.initialize(width, height, fps)
 
-    def send_frame(self, camera_name: str, frame):
-        """Send a frame to all streamers registered for this camera."""
-        if camera_name not in self._streamers:
-            return
-        for streamer in self._streamers[camera_name]:
-            if streamer.is_initialized():
-                streamer.send_frame(frame)
-
-    def get_cameras(self) -> List[str]:
-        """Return list of camera names that have streaming configured."""
-        return list(self._streamers.keys())
+    def send_frame(self, camera_name: str, frame, frame_rgb=None):
+        """Send a frame to all streamers registered for this camera.
+
+        ``frame`` is BGR. Streamers with ``pixel_format == 'RGB'`` receive
+        ``frame_rgb`` if given, otherwise an RGB conversion of ``frame``.
+        """
+        for streamer in self._send_plan.get(camera_name, ()):
+            if streamer._initialized:
+                if streamer.pixel_format == 'RGB':
+                    if frame_rgb is None:
+                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    streamer.send_frame(frame_rgb)
+                else:
+                    streamer.send_frame(frame)
+
+    def get_cameras(self) -> Tuple[str, ...]:
+        """Return the camera names that have streaming configured."""
+        return self._cameras_tuple
 
     def stop(self):
         """Stop all streaming pipelines."""
@@ -95,4 +112,6 @@ class StreamerManager:
             for streamer in streamers:
                 streamer.stop()
         self._streamers.clear()
+        self._cameras_tuple = ()
+        self._send_plan = {}
         print("StreamerManager: all streamers stopped")
\ No newline at end of file